@@ -7,8 +7,14 @@ from pathlib import Path
 
 import joblib
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.metrics import classification_report, confusion_matrix
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
@@ -24,18 +30,103 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--report", type=Path, help="Arquivo JSON para salvar métricas detalhadas")
     parser.add_argument("--test-size", type=float, default=0.3, help="Proporção de dados para teste (padrão: 0.3)")
     parser.add_argument("--random-state", type=int, default=42, help="Semente aleatória para reprodutibilidade")
+    parser.add_argument(
+        "--cache-vectorizer",
+        type=Path,
+        help="Arquivo .joblib para reaproveitar o vetorizador TF-IDF ajustado entre execuções",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Treina em blocos com HashingVectorizer + SGDClassifier, sem carregar o CSV inteiro",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=10_000,
+        help="Linhas lidas por bloco no modo streaming (padrão: 10000)",
+    )
     return parser.parse_args()
 
 
+def read_dataset(path: Path, **kwargs) -> pd.DataFrame:
+    """Lê o CSV com o parser multithread do pyarrow quando instalado."""
+    if _HAS_PYARROW:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    return pd.read_csv(path, **kwargs)
+
+
+def build_classifier() -> LogisticRegression:
+    # liblinear (descida por coordenadas) converge mais rápido que o lbfgs
+    # padrão em bag-of-words esparso e dispensa o max_iter inflado.
+    return LogisticRegression(solver="liblinear", class_weight="balanced", C=1.0)
+
+
 def build_pipeline() -> Pipeline:
     return Pipeline(
         steps=[
             ("tfidf", TfidfVectorizer(ngram_range=(1, 2), min_df=1)),
-            ("clf", LogisticRegression(max_iter=1000, class_weight="balanced")),
+            ("clf", build_classifier()),
         ]
     )
 
 
+def fit_pipeline(X_train, y_train, cache_path: Path | None) -> Pipeline:
+    """Ajusta o pipeline, reaproveitando o vetorizador em cache quando houver.
+
+    Reexecuções sobre o mesmo corpus não precisam reconstruir o vocabulário
+    TF-IDF: com o cache presente, apenas o classificador é treinado sobre a
+    matriz transformada.
+    """
+    if cache_path and cache_path.exists():
+        vectorizer = joblib.load(cache_path)
+        classifier = build_classifier().fit(vectorizer.transform(X_train), y_train)
+        return Pipeline(steps=[("tfidf", vectorizer), ("clf", classifier)])
+    pipeline = build_pipeline()
+    pipeline.fit(X_train, y_train)
+    if cache_path:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(pipeline.named_steps["tfidf"], cache_path)
+    return pipeline
+
+
+def train_streaming(args: argparse.Namespace) -> tuple[Pipeline, "pd.Series", "pd.Series"]:
+    """Treina em blocos para corpora que não cabem confortavelmente em memória.
+
+    O HashingVectorizer dispensa vocabulário e passada de IDF, e o
+    SGDClassifier aceita ``partial_fit``, então cada bloco do CSV é
+    transformado e consumido de uma vez. Uma fração de cada bloco é
+    reservada para o conjunto de teste devolvido ao chamador.
+    """
+    try:
+        labels = read_dataset(args.data, usecols=["situacao"])["situacao"]
+    except ValueError:
+        raise SystemExit("O CSV deve conter as colunas 'frase' e 'situacao'.")
+    classes = sorted(labels.unique())
+
+    vectorizer = HashingVectorizer(n_features=2**18, ngram_range=(1, 2), alternate_sign=False)
+    classifier = SGDClassifier(
+        loss="log_loss", class_weight="balanced", random_state=args.random_state
+    )
+    test_phrases = []
+    test_labels = []
+    for chunk in pd.read_csv(args.data, chunksize=args.chunksize):
+        if {"frase", "situacao"} - set(chunk.columns):
+            raise SystemExit("O CSV deve conter as colunas 'frase' e 'situacao'.")
+        X_train, X_test, y_train, y_test = train_test_split(
+            chunk["frase"],
+            chunk["situacao"],
+            test_size=args.test_size,
+            random_state=args.random_state,
+        )
+        classifier.partial_fit(vectorizer.transform(X_train), y_train, classes=classes)
+        test_phrases.append(X_test)
+        test_labels.append(y_test)
+
+    pipeline = Pipeline(steps=[("hash", vectorizer), ("clf", classifier)])
+    return pipeline, pd.concat(test_phrases), pd.concat(test_labels)
+
+
 def export_metrics(path: Path, report: dict, conf_matrix) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
@@ -50,20 +141,22 @@ def main() -> None:
     if not args.data.exists():
         raise SystemExit(f"Arquivo de dados não encontrado: {args.data}")
 
-    df = pd.read_csv(args.data)
-    if {"frase", "situacao"} - set(df.columns):
-        raise SystemExit("O CSV deve conter as colunas 'frase' e 'situacao'.")
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        df["frase"],
-        df["situacao"],
-        test_size=args.test_size,
-        random_state=args.random_state,
-        stratify=df["situacao"],
-    )
-
-    pipeline = build_pipeline()
-    pipeline.fit(X_train, y_train)
+    if args.streaming:
+        pipeline, X_test, y_test = train_streaming(args)
+    else:
+        df = read_dataset(args.data)
+        if {"frase", "situacao"} - set(df.columns):
+            raise SystemExit("O CSV deve conter as colunas 'frase' e 'situacao'.")
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            df["frase"],
+            df["situacao"],
+            test_size=args.test_size,
+            random_state=args.random_state,
+            stratify=df["situacao"],
+        )
+
+        pipeline = fit_pipeline(X_train, y_train, args.cache_vectorizer)
 
     y_pred = pipeline.predict(X_test)
     accuracy = pipeline.score(X_test, y_test)
@@ -4,11 +4,39 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import operator
+import re
+import sys
 import unicodedata
-from collections import Counter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from numba import njit
+    from numba import types as numba_types
+    from numba.typed import List as NumbaList
+except ImportError:
+    njit = None
+    numba_types = None
+    NumbaList = None
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_REPORTS = BASE_DIR / "data" / "relatos_pacientes.txt"
@@ -23,11 +51,17 @@ SEVERITY_ORDER = {
 }
 SEVERITY_DISPLAY_ORDER = ["crítico", "alto", "moderado", "baixo"]
 
+# Tabela de tradução pré-computada cobrindo os caracteres acentuados do
+# português; evita decompor e filtrar cada string com unicodedata a cada chamada.
+_ACCENTED_CHARS = "áàâãäéèêëíìîïóòôõöúùûüçÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇñÑ"
+_ACCENT_TABLE = str.maketrans(
+    {ord(char): ord(unicodedata.normalize("NFD", char)[0]) for char in _ACCENTED_CHARS}
+)
+
 
 def normalize(text: str) -> str:
     """Lowercase text and strip accents to help with fuzzy matching."""
-    normalized = unicodedata.normalize("NFD", text.lower())
-    return "".join(char for char in normalized if unicodedata.category(char) != "Mn")
+    return text.lower().translate(_ACCENT_TABLE)
 
 
 def normalize_severity(value: str | None) -> str:
@@ -48,33 +82,46 @@ class SymptomRule:
     disease: str
     severity: str
     symptoms: List[str]
+    normalized_symptoms: List[str]
+    severity_rank: int
+    # Ids inteiros (um por sintoma normalizado único entre todas as regras) e
+    # a máscara de bits correspondente; permitem acumular acertos por relato
+    # com OR de inteiros em vez de sets de strings.
+    symptom_ids: List[int]
+    symptom_mask: int
 
-    def matches(self, normalized_report: str) -> List[str]:
-        hits: List[str] = []
-        for raw_symptom in self.symptoms:
-            normalized_symptom = normalize(raw_symptom)
-            if normalized_symptom and normalized_symptom in normalized_report:
-                hits.append(raw_symptom)
-        return hits
 
-    @property
-    def severity_rank(self) -> int:
-        return SEVERITY_ORDER.get(self.severity, SEVERITY_ORDER[normalize(DEFAULT_SEVERITY)])
+def _cell(row: List[str], position: int | None) -> str:
+    if position is None or position >= len(row):
+        return ""
+    return row[position].strip()
 
 
 def load_symptom_rules(path: Path) -> List[SymptomRule]:
+    rules: List[SymptomRule] = []
+    symptom_id_registry: dict[str, int] = {}
     with path.open(newline="", encoding="utf-8") as csv_file:
-        reader = csv.DictReader(csv_file)
-        rules: List[SymptomRule] = []
-        for raw_row in reader:
-            if not raw_row:
+        # csv.reader com índices posicionais evita o dicionário que o
+        # DictReader monta para cada linha.
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
+        if header is None:
+            return rules
+        column_index = {name: position for position, name in enumerate(header)}
+        disease_index = column_index.get("associated_disease")
+        severity_index = column_index.get("severity_level")
+        symptom_indices = [
+            column_index.get(column) for column in ("symptom_1", "symptom_2")
+        ]
+        for row in reader:
+            if not row:
                 continue
-            disease = (raw_row.get("associated_disease") or "").strip()
+            disease = _cell(row, disease_index)
             if not disease:
                 continue
             collected: List[str] = []
-            for column in ("symptom_1", "symptom_2"):
-                cell = (raw_row.get(column) or "").strip()
+            for position in symptom_indices:
+                cell = _cell(row, position)
                 if not cell:
                     continue
                 for item in cell.split(";"):
@@ -82,105 +129,393 @@ def load_symptom_rules(path: Path) -> List[SymptomRule]:
                     if symptom:
                         collected.append(symptom)
             if collected:
-                severity = normalize_severity(raw_row.get("severity_level"))
-                rules.append(SymptomRule(disease=disease, severity=severity, symptoms=collected))
+                severity = normalize_severity(_cell(row, severity_index))
+                # sys.intern deduplica strings repetidas entre regras (doenças,
+                # gravidades e sintomas compartilhados), reduzindo memória e
+                # permitindo comparações por identidade nos dicionários.
+                normalized_symptoms = [
+                    sys.intern(normalize(symptom)) for symptom in collected
+                ]
+                symptom_ids = [
+                    symptom_id_registry.setdefault(normalized, len(symptom_id_registry))
+                    for normalized in normalized_symptoms
+                ]
+                symptom_mask = 0
+                for symptom_id in symptom_ids:
+                    symptom_mask |= 1 << symptom_id
+                rules.append(
+                    SymptomRule(
+                        disease=sys.intern(disease),
+                        severity=sys.intern(severity),
+                        symptoms=collected,
+                        normalized_symptoms=normalized_symptoms,
+                        severity_rank=SEVERITY_ORDER.get(severity, SEVERITY_ORDER[DEFAULT_SEVERITY]),
+                        symptom_ids=symptom_ids,
+                        symptom_mask=symptom_mask,
+                    )
+                )
     return rules
 
 
+def build_symptom_automaton(rules: List[SymptomRule]):
+    """Monta um autômato Aho-Corasick com todos os sintomas normalizados.
+
+    Permite varrer cada relato em uma única passada, em vez de testar cada
+    sintoma individualmente. Retorna ``None`` quando ``pyahocorasick`` não
+    está instalado, caso em que o chamador usa a verificação regra a regra.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rule_index, rule in enumerate(rules):
+        for normalized_symptom, symptom_id in zip(rule.normalized_symptoms, rule.symptom_ids):
+            if not normalized_symptom:
+                continue
+            if automaton.exists(normalized_symptom):
+                automaton.get(normalized_symptom)[1].append(rule_index)
+            else:
+                automaton.add_word(normalized_symptom, (symptom_id, [rule_index]))
+    automaton.make_automaton()
+    return automaton
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _scan_symptoms_jit(normalized_report, normalized_symptoms):
+        hits = []
+        for symptom_index in range(len(normalized_symptoms)):
+            if normalized_symptoms[symptom_index] in normalized_report:
+                hits.append(symptom_index)
+        return hits
+
+
+def build_symptom_scanner(rules: List[SymptomRule]):
+    """Prepara o scanner JIT (Numba) com a lista de sintomas normalizados.
+
+    Nível intermediário entre o autômato e a regex: compila o laço de
+    checagens de substring com Numba, que traz um ``find`` otimizado para
+    strings, removendo o despacho do interpretador do laço interno. Retorna
+    ``None`` quando Numba não está instalado ou não há sintomas.
+    """
+    if njit is None:
+        return None
+    entries_by_position: List[tuple] = []
+    symptom_list = NumbaList.empty_list(numba_types.unicode_type)
+    seen: dict[str, int] = {}
+    for rule_index, rule in enumerate(rules):
+        for normalized_symptom, symptom_id in zip(rule.normalized_symptoms, rule.symptom_ids):
+            if not normalized_symptom:
+                continue
+            position = seen.get(normalized_symptom)
+            if position is None:
+                position = len(entries_by_position)
+                seen[normalized_symptom] = position
+                symptom_list.append(normalized_symptom)
+                entries_by_position.append((symptom_id, []))
+            entries_by_position[position][1].append(rule_index)
+    if not entries_by_position:
+        return None
+    return symptom_list, entries_by_position
+
+
+def build_symptom_regex(rules: List[SymptomRule]):
+    """Compila uma alternação única com todos os sintomas normalizados.
+
+    Usada como alternativa ao autômato quando ``pyahocorasick`` não está
+    disponível: uma chamada ao motor de regex (em C) substitui as dezenas de
+    checagens de substring em Python por relato. O lookahead de largura zero
+    encontra ocorrências sobrepostas, e sintomas contidos em outros são
+    expandidos para preservar a semântica da checagem por substring.
+    """
+    entries_by_symptom: dict[str, tuple] = {}
+    for rule_index, rule in enumerate(rules):
+        for normalized_symptom, symptom_id in zip(rule.normalized_symptoms, rule.symptom_ids):
+            if normalized_symptom:
+                entry = entries_by_symptom.setdefault(normalized_symptom, (symptom_id, []))
+                entry[1].append(rule_index)
+    if not entries_by_symptom:
+        return None
+    expanded: dict[str, tuple] = {}
+    for pattern_text, (symptom_id, own_rules) in entries_by_symptom.items():
+        combined_mask = 1 << symptom_id
+        combined_rules = list(own_rules)
+        for other_text, (other_id, other_rules) in entries_by_symptom.items():
+            if other_text != pattern_text and other_text in pattern_text:
+                combined_mask |= 1 << other_id
+                combined_rules.extend(other_rules)
+        expanded[pattern_text] = (combined_mask, combined_rules)
+    alternation = "|".join(
+        re.escape(symptom) for symptom in sorted(expanded, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))"), expanded
+
+
 def load_reports(path: Path) -> List[str]:
     with path.open(encoding="utf-8") as file:
         return [line.strip() for line in file if line.strip()]
 
 
-def diagnose(reports: Iterable[str], rules: Iterable[SymptomRule]) -> List[dict]:
-    results: List[dict] = []
-    for index, report in enumerate(reports, start=1):
-        normalized_report = normalize(report)
-        matched_symptoms = set()
-        matches = {}
-        highest_rank = -1
-        highest_label = None
-
-        for rule in rules:
-            hits = rule.matches(normalized_report)
-            if hits:
-                matched_symptoms.update(hits)
-                key = (rule.disease, rule.severity)
-                matches.setdefault(key, set()).update(hits)
-                if rule.severity_rank > highest_rank:
-                    highest_rank = rule.severity_rank
-                    highest_label = rule.severity
-
-        matched_rules = [
+def normalize_reports(reports: List[str]) -> List[str]:
+    """Normaliza todos os relatos em lote.
+
+    Com pandas instalado, a coluna inteira é normalizada pelas operações
+    vetorizadas ``.str`` (loops em C), o que compensa quando há milhares de
+    relatos; sem pandas, aplica ``normalize`` item a item.
+    """
+    if pd is not None:
+        series = pd.Series(reports, dtype="object")
+        return (
+            series.str.normalize("NFD")
+            .str.encode("ascii", "ignore")
+            .str.decode("ascii")
+            .str.lower()
+            .tolist()
+        )
+    return [normalize(report) for report in reports]
+
+
+def build_matchers(rules: List[SymptomRule]):
+    """Escolhe a estratégia de varredura disponível mais rápida, em ordem."""
+    automaton = build_symptom_automaton(rules)
+    jit_scanner = build_symptom_scanner(rules) if automaton is None else None
+    regex_matcher = (
+        build_symptom_regex(rules) if automaton is None and jit_scanner is None else None
+    )
+    return automaton, jit_scanner, regex_matcher
+
+
+def _diagnose_report(
+    index: int,
+    report: str,
+    normalized_report: str,
+    rules: List[SymptomRule],
+    matchers,
+) -> dict:
+    automaton, jit_scanner, regex_matcher = matchers
+    matched_symptoms = set()
+    # defaultdict evita alocar um set descartável a cada chave já existente,
+    # o que pesa no GC dentro do laço por relato.
+    matches: defaultdict = defaultdict(set)
+    highest_rank = -1
+    highest_label = None
+
+    # Acertos acumulados como bits de um inteiro (um bit por sintoma
+    # normalizado único): OR entre inteiros é bem mais barato que inserir
+    # strings em um set a cada ocorrência.
+    hit_mask = 0
+    candidate_rules: set[int] = set()
+    if automaton is not None:
+        for _end_index, (symptom_id, rule_indices) in automaton.iter(normalized_report):
+            hit_mask |= 1 << symptom_id
+            candidate_rules.update(rule_indices)
+    elif jit_scanner is not None:
+        symptom_list, entries_by_position = jit_scanner
+        for position in _scan_symptoms_jit(normalized_report, symptom_list):
+            symptom_id, rule_indices = entries_by_position[position]
+            hit_mask |= 1 << symptom_id
+            candidate_rules.update(rule_indices)
+    elif regex_matcher is not None:
+        pattern, expanded = regex_matcher
+        for found_symptom in set(pattern.findall(normalized_report)):
+            symptom_mask, rule_indices = expanded[found_symptom]
+            hit_mask |= symptom_mask
+            candidate_rules.update(rule_indices)
+
+    # Visita apenas as regras apontadas pelo índice de sintomas; a ordenação
+    # preserva o desempate original (primeira regra do CSV com maior gravidade).
+    for rule_index in sorted(candidate_rules):
+        rule = rules[rule_index]
+        if not rule.symptom_mask & hit_mask:
+            continue
+        hits = [
+            raw_symptom
+            for raw_symptom, symptom_id in zip(rule.symptoms, rule.symptom_ids)
+            if hit_mask >> symptom_id & 1
+        ]
+        matched_symptoms.update(hits)
+        matches[(rule.disease, rule.severity)].update(hits)
+        if rule.severity_rank > highest_rank:
+            highest_rank = rule.severity_rank
+            highest_label = rule.severity
+
+    decorated_rules = [
+        (
+            (-SEVERITY_ORDER.get(severity, 0), disease),
             {
                 "disease": disease,
                 "severity": severity,
                 "matched_symptoms": sorted(symptoms),
-            }
-            for (disease, severity), symptoms in matches.items()
-        ]
-        matched_rules.sort(
-            key=lambda item: (
-                -SEVERITY_ORDER.get(item["severity"], 0),
-                item["disease"],
-            )
+            },
         )
+        for (disease, severity), symptoms in matches.items()
+    ]
+    decorated_rules.sort(key=operator.itemgetter(0))
+    matched_rules = [entry for _sort_key, entry in decorated_rules]
+
+    return {
+        "report_id": index,
+        "report": report,
+        "matched_symptoms": sorted(matched_symptoms),
+        "diagnosis_matches": matched_rules,
+        "max_severity": highest_label,
+    }
+
+
+_worker_rules: List[SymptomRule] | None = None
+_worker_matchers = None
 
-        results.append(
-            {
-                "report_id": index,
-                "report": report,
-                "matched_symptoms": sorted(matched_symptoms),
-                "diagnosis_matches": matched_rules,
-                "max_severity": highest_label,
-            }
-        )
-    return results
 
+def _init_diagnose_worker(rules: List[SymptomRule]) -> None:
+    """Reconstrói regras e matchers uma vez por processo filho."""
+    global _worker_rules, _worker_matchers
+    _worker_rules = rules
+    _worker_matchers = build_matchers(rules)
 
-def summarize_results(results: List[dict]) -> dict:
-    total = len(results)
-    with_symptoms = sum(1 for item in results if item["matched_symptoms"])
-    with_diagnosis = sum(1 for item in results if item["diagnosis_matches"])
-    severity_counter = Counter(item["max_severity"] for item in results if item["max_severity"])
+
+def _diagnose_one(payload) -> dict:
+    index, report, normalized_report = payload
+    return _diagnose_report(index, report, normalized_report, _worker_rules, _worker_matchers)
+
+
+def diagnose_iter(
+    reports: Iterable[str],
+    rules: Iterable[SymptomRule],
+    jobs: int = 1,
+) -> Iterator[dict]:
+    """Produz um resultado por relato sem materializar a lista completa.
+
+    Consumidores que imprimem, somam estatísticas ou exportam em fluxo
+    mantêm o pico de memória em O(1) nos resultados, em vez de O(relatos).
+    """
+    rules = list(rules)
+    reports = list(reports)
+    normalized_reports = normalize_reports(reports)
+    payloads = [
+        (index, report, normalized_report)
+        for index, (report, normalized_report) in enumerate(
+            zip(reports, normalized_reports), start=1
+        )
+    ]
+    if jobs > 1 and len(payloads) > 1:
+        # Cada relato é independente; distribuir em processos escala com os
+        # núcleos disponíveis sem estado compartilhado entre relatos.
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_diagnose_worker, initargs=(rules,)
+        ) as executor:
+            yield from executor.map(_diagnose_one, payloads, chunksize=64)
+        return
+    matchers = build_matchers(rules)
+    for index, report, normalized_report in payloads:
+        yield _diagnose_report(index, report, normalized_report, rules, matchers)
+
+
+def diagnose(
+    reports: Iterable[str],
+    rules: Iterable[SymptomRule],
+    jobs: int = 1,
+) -> List[dict]:
+    return list(diagnose_iter(reports, rules, jobs=jobs))
+
+
+def new_summary() -> dict:
     return {
-        "reports": total,
-        "reports_with_symptoms": with_symptoms,
-        "reports_with_diagnosis": with_diagnosis,
-        "severity_distribution": dict(severity_counter),
+        "reports": 0,
+        "reports_with_symptoms": 0,
+        "reports_with_diagnosis": 0,
+        "severity_distribution": {},
     }
 
 
-def export_results(results: List[dict], destination: Path, fmt: str) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    fmt = fmt.lower()
-    if fmt == "json":
-        destination.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
-    elif fmt == "csv":
-        fieldnames = [
-            "report_id",
-            "report",
-            "matched_symptoms",
-            "diagnosis_matches",
-            "max_severity",
-        ]
-        with destination.open("w", newline="", encoding="utf-8") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            for item in results:
-                writer.writerow(
-                    {
-                        "report_id": item["report_id"],
-                        "report": item["report"],
-                        "matched_symptoms": "; ".join(item["matched_symptoms"]),
-                        "diagnosis_matches": "; ".join(
-                            f"{match['disease']} (gravidade: {match['severity']})" for match in item["diagnosis_matches"]
-                        ),
-                        "max_severity": item["max_severity"] or "nao_classificado",
-                    }
+def update_summary(summary: dict, item: dict) -> None:
+    summary["reports"] += 1
+    if item["matched_symptoms"]:
+        summary["reports_with_symptoms"] += 1
+    if item["diagnosis_matches"]:
+        summary["reports_with_diagnosis"] += 1
+    severity = item["max_severity"]
+    if severity:
+        distribution = summary["severity_distribution"]
+        distribution[severity] = distribution.get(severity, 0) + 1
+
+
+def summarize_results(results: Iterable[dict]) -> dict:
+    summary = new_summary()
+    for item in results:
+        update_summary(summary, item)
+    return summary
+
+
+def _dump_json_item(item: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+    return json.dumps(item, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class ResultWriter:
+    """Grava resultados um a um no destino, sem materializar a lista.
+
+    Mantém o arquivo exportado byte a byte igual ao da escrita em lote: o
+    CSV emite cabeçalho e depois uma linha por resultado, e o JSON monta o
+    array manualmente, reindentando cada item em dois espaços.
+    """
+
+    _FIELDNAMES = [
+        "report_id",
+        "report",
+        "matched_symptoms",
+        "diagnosis_matches",
+        "max_severity",
+    ]
+
+    def __init__(self, destination: Path, fmt: str) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt.lower()
+        self._count = 0
+        if self.fmt == "json":
+            self._file = destination.open("wb")
+        elif self.fmt == "csv":
+            self._file = destination.open("w", newline="", encoding="utf-8")
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(self._FIELDNAMES)
+        else:
+            raise ValueError(f"Formato de exportação não suportado: {fmt}")
+
+    def write(self, item: dict) -> None:
+        if self.fmt == "json":
+            prefix = b"[\n" if self._count == 0 else b",\n"
+            indented = b"\n".join(
+                b"  " + line for line in _dump_json_item(item).splitlines()
+            )
+            self._file.write(prefix + indented)
+        else:
+            self._csv_writer.writerow(
+                (
+                    item["report_id"],
+                    item["report"],
+                    "; ".join(item["matched_symptoms"]),
+                    "; ".join(
+                        f"{match['disease']} (gravidade: {match['severity']})"
+                        for match in item["diagnosis_matches"]
+                    ),
+                    item["max_severity"] or "nao_classificado",
                 )
-    else:
-        raise ValueError(f"Formato de exportação não suportado: {fmt}")
+            )
+        self._count += 1
+
+    def close(self) -> None:
+        if self.fmt == "json":
+            self._file.write(b"[]" if self._count == 0 else b"\n]")
+        self._file.close()
+
+
+def export_results(results: Iterable[dict], destination: Path, fmt: str) -> None:
+    writer = ResultWriter(destination, fmt)
+    try:
+        for item in results:
+            writer.write(item)
+    finally:
+        writer.close()
 
 
 def infer_export_format(path: Path, explicit_format: str | None) -> str:
@@ -202,6 +537,12 @@ def parse_args() -> argparse.Namespace:
         choices=("json", "csv"),
         help="Formato do arquivo exportado. Quando omitido, é deduzido pela extensão.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de processos para diagnosticar em paralelo (padrão: 1)",
+    )
     return parser.parse_args()
 
 
@@ -215,44 +556,57 @@ def main() -> None:
     if not reports:
         raise SystemExit(f"Nenhum relato foi encontrado em {args.reports}")
 
-    results = diagnose(reports, rules)
-    for item in results:
-        print(f"Relato {item['report_id']}: {item['report']}")
+    result_writer = None
+    if args.export:
+        export_format = infer_export_format(args.export, args.format)
+        result_writer = ResultWriter(args.export, export_format)
+
+    # Uma única passada pelos resultados: imprime, atualiza o resumo e
+    # exporta cada item assim que ele é produzido pelo gerador.
+    summary = new_summary()
+    # Acumula as linhas e grava o bloco inteiro de uma vez: um único write em
+    # vez de um print (com lock e flush de stdout) por linha.
+    lines: List[str] = []
+    for item in diagnose_iter(reports, rules, jobs=args.jobs):
+        update_summary(summary, item)
+        if result_writer is not None:
+            result_writer.write(item)
+        lines.append(f"Relato {item['report_id']}: {item['report']}")
         if item["matched_symptoms"]:
-            print("  Sintomas reconhecidos:")
+            lines.append("  Sintomas reconhecidos:")
             for symptom in item["matched_symptoms"]:
-                print(f"    - {symptom}")
+                lines.append(f"    - {symptom}")
         else:
-            print("  Sintomas reconhecidos: nenhum mapeado")
+            lines.append("  Sintomas reconhecidos: nenhum mapeado")
 
         if item["diagnosis_matches"]:
-            print("  Diagnósticos sugeridos:")
+            lines.append("  Diagnósticos sugeridos:")
             for match in item["diagnosis_matches"]:
-                print(f"    - {match['disease']} (gravidade: {match['severity']})")
+                lines.append(f"    - {match['disease']} (gravidade: {match['severity']})")
             if item["max_severity"]:
-                print(f"  Gravidade máxima indicada: {item['max_severity']}")
+                lines.append(f"  Gravidade máxima indicada: {item['max_severity']}")
         else:
-            print("  Diagnósticos sugeridos: revisão manual necessária")
-        print()
-
-    summary = summarize_results(results)
-    print("Resumo geral:")
-    print(f"  Relatos analisados: {summary['reports']}")
-    print(f"  Relatos com sintomas reconhecidos: {summary['reports_with_symptoms']}")
-    print(f"  Relatos com diagnóstico sugerido: {summary['reports_with_diagnosis']}")
+            lines.append("  Diagnósticos sugeridos: revisão manual necessária")
+        lines.append("")
+
+    lines.append("Resumo geral:")
+    lines.append(f"  Relatos analisados: {summary['reports']}")
+    lines.append(f"  Relatos com sintomas reconhecidos: {summary['reports_with_symptoms']}")
+    lines.append(f"  Relatos com diagnóstico sugerido: {summary['reports_with_diagnosis']}")
     if summary["severity_distribution"]:
-        print("  Distribuição de gravidade sugerida:")
+        lines.append("  Distribuição de gravidade sugerida:")
         for severity in SEVERITY_DISPLAY_ORDER:
             count = summary["severity_distribution"].get(severity)
             if count:
-                print(f"    - {severity}: {count}")
+                lines.append(f"    - {severity}: {count}")
     else:
-        print("  Distribuição de gravidade sugerida: nenhum caso classificado")
+        lines.append("  Distribuição de gravidade sugerida: nenhum caso classificado")
 
-    if args.export:
-        export_format = infer_export_format(args.export, args.format)
-        export_results(results, args.export, export_format)
-        print(f"\nResultados exportados para {args.export} ({export_format.upper()}).")
+    if result_writer is not None:
+        result_writer.close()
+        lines.append(f"\nResultados exportados para {args.export} ({export_format.upper()}).")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":